@@ -0,0 +1,363 @@
+"""
+Shared HTTP plumbing for the IUCN Red List API.
+
+Holds the API key, the pooled requests session, the httpx async client
+for the concurrent fetch paths, rate limiting and the disk-backed
+response cache, so tracker.py only deals with species data and the UI.
+"""
+import asyncio
+import atexit
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future
+from decouple import config
+from functools import lru_cache
+from diskcache import Cache
+import logging
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenRedactionFilter(logging.Filter):
+    """Strip the API token from any URL that ends up in a log record."""
+
+    def filter(self, record):
+        message = record.getMessage()
+        if 'token=' in message:
+            record.msg = re.sub(r'token=[^&\s]+', 'token=<redacted>', message)
+            record.args = ()
+        return True
+
+
+# Attach to our own logger, to urllib3's (logs request URLs at debug
+# level) and to httpx's (logs the full URL of every completed request at
+# info level, which tracker.py's basicConfig would print).
+for _name in (__name__, 'urllib3.connectionpool', 'httpx'):
+    logging.getLogger(_name).addFilter(_TokenRedactionFilter())
+
+# Load API key from environment variables
+IUCN_API_KEY = config("IUCN_API_KEY", default=None)
+if not IUCN_API_KEY:
+    logger.error("IUCN_API_KEY is not set. Please set the API key in the environment variables.")
+    raise ValueError("IUCN_API_KEY is not set")
+
+# IUCN Red List API endpoint
+IUCN_API_URL = "https://apiv3.iucnredlist.org/api/v3/"
+
+# Retry transient failures (429 and 5xx) with exponential backoff and
+# jitter so a single flaky response doesn't surface as "species not found".
+_retry = Retry(total=3, backoff_factor=1.0, backoff_jitter=0.5,
+               status_forcelist=[429, 500, 502, 503, 504],
+               allowed_methods=["GET"], respect_retry_after_header=True)
+
+# Shared session with connection pooling: keep-alive reuses the TLS
+# connection to the IUCN API instead of re-handshaking on every call.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(max_retries=_retry,
+                                       pool_connections=16, pool_maxsize=32))
+# Ask for compressed payloads; requests decodes transparently and the
+# list/narrative endpoints shrink ~5x on the wire.
+_session.headers.update({"Accept": "application/json",
+                         "Accept-Encoding": "gzip, deflate, br"})
+atexit.register(_session.close)
+
+# Rate limiting: 10 calls per second against the IUCN quota
+RATE_LIMIT_CALLS = 10
+RATE_LIMIT_PERIOD = 1.0
+
+# One token bucket shared by the sync and async paths, refilled on the
+# monotonic clock — two independent limiters would let mixed traffic
+# (background warmers plus UI coroutines) hit double the quota. Unlike
+# ratelimit's sleep_and_retry this only sleeps for the exact token wait,
+# with a little jitter so callers don't wake in lockstep.
+_bucket_lock = threading.Lock()
+_bucket_tokens = float(RATE_LIMIT_CALLS)
+_bucket_refill_time = time.monotonic()
+
+
+def _acquire_token():
+    """Take one token if available, else return how long to wait first."""
+    global _bucket_tokens, _bucket_refill_time
+    with _bucket_lock:
+        now = time.monotonic()
+        _bucket_tokens = min(
+            float(RATE_LIMIT_CALLS),
+            _bucket_tokens + (now - _bucket_refill_time) * RATE_LIMIT_CALLS / RATE_LIMIT_PERIOD)
+        _bucket_refill_time = now
+        if _bucket_tokens >= 1.0:
+            _bucket_tokens -= 1.0
+            return None
+        return (1.0 - _bucket_tokens) * RATE_LIMIT_PERIOD / RATE_LIMIT_CALLS
+
+
+def _throttle():
+    """Block until a rate-limit token is available (sync call paths)."""
+    while (wait := _acquire_token()) is not None:
+        time.sleep(wait + random.uniform(0, 0.05))
+
+
+async def _athrottle():
+    """Async counterpart of _throttle, drawing on the same bucket."""
+    while (wait := _acquire_token()) is not None:
+        await asyncio.sleep(wait + random.uniform(0, 0.05))
+
+
+# Disk-backed cache so API responses survive app restarts; IUCN data
+# rarely changes, so entries stay valid for a day.
+disk_cache = Cache(".iucn_cache")
+atexit.register(disk_cache.close)
+API_CACHE_TTL = 86400  # seconds
+
+# httpx client for the concurrent fetch paths. HTTP/2 multiplexes all
+# concurrent requests over one TLS connection (httpx negotiates down to
+# HTTP/1.1 if the server declines). Created lazily because the client must
+# be bound to the running event loop; recreated if the loop has changed
+# (e.g. successive asyncio.run calls).
+_async_client = None
+_async_client_loop = None
+
+
+async def get_async_client():
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if (_async_client is None or _async_client.is_closed
+            or _async_client_loop is not loop):
+        if _async_client is not None and not _async_client.is_closed:
+            # Close the superseded client so its pooled connections don't
+            # leak across asyncio.run calls; if its loop is already gone,
+            # aclose raises and the sockets died with the loop anyway.
+            try:
+                await _async_client.aclose()
+            except RuntimeError:
+                pass
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            timeout=10.0,
+            headers={"Accept": "application/json",
+                     "Accept-Encoding": "gzip, deflate, br"})
+        _async_client_loop = loop
+    return _async_client
+
+
+# In-flight async fetches, the event-loop counterpart of _inflight below.
+# The loop is single-threaded, so a plain dict needs no lock.
+_async_inflight = {}
+
+
+async def afetch(client, endpoint, params=None):
+    """
+    Async counterpart of api_call: fetch one IUCN endpoint on the event loop.
+    Concurrent misses on the same key (e.g. two users clicking the same
+    species at once) share a single upstream request.
+
+    :param client: The httpx AsyncClient to use
+    :param endpoint: The API endpoint to call
+    :param params: Optional parameters to pass in the query string
+    :return: The JSON response from the API, or None if the call failed
+    """
+    params_key = tuple(sorted((params or {}).items()))
+    cache_key = ('json', endpoint, params_key)
+    cached = disk_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    key = (endpoint, params_key)
+    task = _async_inflight.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(
+            _afetch_upstream(client, endpoint, params_key, cache_key))
+        _async_inflight[key] = task
+
+        def _done(finished, key=key, task=task):
+            if _async_inflight.get(key) is task:
+                del _async_inflight[key]
+
+        task.add_done_callback(_done)
+    return await task
+
+
+def _async_backoff(attempt, retry_after=None):
+    """Backoff delay matching the sync adapter's Retry settings."""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return (_retry.backoff_factor * (2 ** attempt)
+            + random.uniform(0, _retry.backoff_jitter))
+
+
+async def _afetch_upstream(client, endpoint, params_key, cache_key):
+    """
+    Issue the upstream request for an afetch cache miss, retrying transient
+    failures (httpx has no equivalent of the urllib3 Retry adapter, so the
+    same total/statuses/backoff policy is applied by hand here).
+    """
+    request_params = dict(params_key)
+    request_params['token'] = IUCN_API_KEY
+    url = f"{IUCN_API_URL}{endpoint}"
+    delay = None
+    for attempt in range(_retry.total + 1):
+        if attempt:
+            await asyncio.sleep(delay)
+        try:
+            await _athrottle()
+            response = await client.get(url, params=request_params)
+        except httpx.TransportError as e:
+            if attempt < _retry.total:
+                delay = _async_backoff(attempt)
+                continue
+            # warning, not exception: formatting a traceback per failed call
+            # is real CPU during an outage, and the stack is always the same
+            logger.warning("API call %s failed: %s", endpoint, e)
+            return None
+        if (response.status_code in _retry.status_forcelist
+                and attempt < _retry.total):
+            delay = _async_backoff(attempt,
+                                   response.headers.get('Retry-After'))
+            continue
+        try:
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.warning("API call %s failed: %s", endpoint, e)
+            return None
+        except ValueError as e:
+            logger.exception("Invalid JSON response from %s: %s", endpoint, e)
+            return None
+        disk_cache.set(cache_key, result, expire=API_CACHE_TTL)
+        return result
+
+
+class _FetchFailed(Exception):
+    """
+    Internal marker for a failed upstream call. lru_cache doesn't memoize
+    calls that raise, so failures propagate as this instead of None and the
+    next call retries upstream rather than serving a cached "not found".
+    """
+
+
+def api_call(endpoint, params=()):
+    """
+    Make an API call to the IUCN Red List API with rate limiting and caching.
+
+    :param endpoint: The API endpoint to call
+    :param params: Optional query parameters as a tuple of (key, value)
+        pairs; a dict is accepted and normalized. Never mutated.
+    :return: The JSON response from the API, or None if the call failed
+    """
+    if isinstance(params, dict):
+        params = params.items()
+    try:
+        return _get_json(endpoint, tuple(sorted(params)))
+    except _FetchFailed:
+        return None
+
+
+_CACHE_STATS_EVERY = 100  # log hit rate every N in-memory misses
+_miss_count = 0
+
+
+def log_cache_stats():
+    """Log the in-memory JSON cache hit/miss counters."""
+    info = _get_json.cache_info()
+    logger.info("JSON cache: hits=%d misses=%d size=%d/%d",
+                info.hits, info.misses, info.currsize, info.maxsize)
+
+
+@lru_cache(maxsize=4096)
+def _get_json(endpoint, params_key):
+    """
+    Single decoded-JSON cache shared by every endpoint: lru_cache in memory,
+    disk cache underneath. Callers project the fields they need from the
+    shared entry instead of keeping their own cached copies, and the hit
+    path never touches the rate limiter.
+    """
+    global _miss_count
+    _miss_count += 1
+    if _miss_count % _CACHE_STATS_EVERY == 0:
+        log_cache_stats()
+    cache_key = ('json', endpoint, params_key)
+    cached = disk_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    result = _coalesced_request(endpoint, params_key)
+    if result is None:
+        raise _FetchFailed(endpoint)
+    disk_cache.set(cache_key, result, expire=API_CACHE_TTL)
+    return result
+
+
+# In-flight upstream calls, so concurrent misses on the same key share one
+# request instead of racing to fetch it twice
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _coalesced_request(endpoint, params_key):
+    """
+    Issue the upstream request for a cache miss, sharing one in-flight call
+    among concurrent callers with the same key. The caches don't protect the
+    in-flight window: without this, two users clicking the same species at
+    once would both go to the network.
+    """
+    key = (endpoint, params_key)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[key] = future
+    if not leader:
+        return future.result()
+    try:
+        result = _request_json(endpoint, dict(params_key))
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def fetch_fresh(endpoint, params=()):
+    """
+    Fetch an endpoint bypassing the JSON caches, for callers that manage
+    their own freshness (still rate limited and retried).
+
+    :param endpoint: The API endpoint to call
+    :param params: Optional query parameters as a tuple of (key, value) pairs
+    :return: The JSON response from the API, or None if the call failed
+    """
+    return _request_json(endpoint, dict(params))
+
+
+def _request_json(endpoint, params):
+    """Issue one rate-limited GET against the API (the cache-miss path)."""
+    try:
+        url = f"{IUCN_API_URL}{endpoint}"
+        params = dict(params) | {'token': IUCN_API_KEY}
+        _throttle()
+        response = _session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        # orjson decodes in native code, well ahead of stdlib json
+        return orjson.loads(response.content)
+    except requests.exceptions.RequestException as e:
+        # See afetch: transient HTTP failures don't warrant a traceback
+        logger.warning("API call %s failed: %s", endpoint, e)
+        return None
+    except ValueError as e:
+        # A non-JSON body is genuinely unexpected; keep the full traceback
+        logger.exception("Invalid JSON response from %s: %s", endpoint, e)
+        return None
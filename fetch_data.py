@@ -1,18 +1,28 @@
+import atexit
+
+import orjson
 import requests
 from decouple import config
 
 
 API_KEY = config("IUCN_API_KEY")
 
+# One shared session so HTTP keep-alive reuses the TCP+TLS connection
+# across calls instead of paying a fresh handshake per request.
+_session = requests.Session()
+_session.headers.update({"Authorization": f"Bearer {API_KEY}",
+                         "Accept": "application/json",
+                         "Accept-Encoding": "gzip, deflate, br"})
+atexit.register(_session.close)
+
 
 def fetch_data(endpoint, params=None):
     if params is None:
         params = {}
     try:
-        response = requests.get(endpoint, params=params, 
-                                headers={"Bearer": API_KEY}, timeout=None)
+        response = _session.get(endpoint, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data: {e}")
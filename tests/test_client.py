@@ -0,0 +1,120 @@
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+import client
+
+
+class TestApiCallCache:
+
+    def setup_method(self):
+        client._get_json.cache_clear()
+        client.disk_cache.clear()
+
+    def teardown_method(self):
+        client._get_json.cache_clear()
+        client.disk_cache.clear()
+
+    # A cache hit must not consume a rate-limit token or touch the network
+    @patch('client._throttle')
+    @patch('client._session.get')
+    def test_cache_hit_skips_limiter_and_network(self, mock_get, mock_throttle):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"result": [1]}'
+
+        first = client.api_call('species/page', {'page': 0})
+        second = client.api_call('species/page', {'page': 0})
+
+        assert first == {'result': [1]}
+        assert second == first
+        assert mock_get.call_count == 1
+        assert mock_throttle.call_count == 1
+
+    # Dict params must hash cleanly and key the cache per page
+    @patch('client._throttle')
+    @patch('client._session.get')
+    def test_parameterized_calls_are_cacheable(self, mock_get, mock_throttle):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"result": []}'
+
+        client.api_call('species/page', {'page': 0})
+        client.api_call('species/page', {'page': 1})
+        client.api_call('species/page', {'page': 1})
+
+        assert mock_get.call_count == 2
+
+    # Tuple and dict spellings of the same params share one cache entry
+    @patch('client._throttle')
+    @patch('client._session.get')
+    def test_params_normalized_to_one_key(self, mock_get, mock_throttle):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"result": []}'
+
+        client.api_call('species/page', {'page': 2})
+        client.api_call('species/page', (('page', 2),))
+
+        assert mock_get.call_count == 1
+
+    # A failed call must not be memoized as "not found"; the next call
+    # retries upstream
+    @patch('client._throttle')
+    @patch('client._session.get')
+    def test_failures_are_not_cached(self, mock_get, mock_throttle):
+        recovered = Mock()
+        recovered.status_code = 200
+        recovered.content = b'{"result": [1]}'
+        mock_get.side_effect = [requests.exceptions.ConnectionError(), recovered]
+
+        assert client.api_call('species/Panthera leo') is None
+        assert client.api_call('species/Panthera leo') == {'result': [1]}
+        assert mock_get.call_count == 2
+
+    # Concurrent misses on the same key share a single upstream request
+    def test_inflight_requests_are_coalesced(self):
+        import threading
+        import time
+
+        calls = []
+
+        def slow_request(endpoint, params):
+            calls.append(endpoint)
+            time.sleep(0.2)
+            return {'result': []}
+
+        with patch('client._request_json', side_effect=slow_request):
+            threads = [
+                threading.Thread(
+                    target=client._coalesced_request, args=('species/Panthera leo', ()))
+                for _ in range(5)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+
+    # Same for the async path: concurrent afetch misses share one request
+    def test_async_inflight_requests_are_coalesced(self):
+        import asyncio
+
+        calls = []
+
+        class FakeClient:
+            async def get(self, url, params=None):
+                calls.append(url)
+                await asyncio.sleep(0.1)
+                response = Mock()
+                response.content = b'{"result": []}'
+                return response
+
+        async def run():
+            fake = FakeClient()
+            return await asyncio.gather(
+                *[client.afetch(fake, 'species/Panthera leo')
+                  for _ in range(5)])
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [{'result': []}] * 5
@@ -25,12 +25,11 @@ class TestFetchData:
         assert result.get('error') is not None
 
     # Test fetching country list with incorrect token (Expect 500)
-    @patch('fetch_data.requests.get')
+    @patch('fetch_data._session.get')
     def test_fetch_country_list_failure_incorrect_token(self, mock_get):
         # Mocking a 500 response
         mock_get.return_value.status_code = 500
-        mock_get.return_value.json.return_value = {
-            "error": "Internal Server Error"}
+        mock_get.return_value.content = b'{"error": "Internal Server Error"}'
 
         endpoint = ENDPOINT + 'country/list?token=69'
         result = fetch_data(endpoint)
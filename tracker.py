@@ -1,310 +1,503 @@
-import requests
-import gradio as gr
-from decouple import config
-import plotly.graph_objects as go
-import plotly.express as px
-from functools import lru_cache
-import pandas as pd
-from ratelimit import limits, sleep_and_retry
-import logging
-import time
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Load API key from environment variables
-UCN_API_KEY = config("IUCN_API_KEY", default=None)
-if not UCN_API_KEY:
-    logger.error("IUCN_API_KEY is not set. Please set the API key in the environment variables.")
-    raise ValueError("IUCN_API_KEY is not set")
-
-# IUCN Red List API endpoint
-IUCN_API_URL = "https://apiv3.iucnredlist.org/api/v3/"
-
-# Rate limiting: 10 calls per second
-@sleep_and_retry
-@limits(calls=10, period=1)  # 10 calls per second
-@lru_cache(maxsize=1000)  # Cache up to 1000 calls
-
-
-def api_call(endpoint, params=None):
-    """
-    Make an API call to the IUCN Red List API with rate limiting and caching.
-
-    :param endpoint: The API endpoint to call
-    :param params: Optional parameters to pass in the query string
-    :return: The JSON response from the API, or None if the call failed
-    """
-    try:
-        url = f"{IUCN_API_URL}{endpoint}"
-        params = params or {}
-        params['token'] = UCN_API_KEY
-        response = requests.get(url, params=params, timeout=10)  # Added timeout
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.exception(f"API call failed: {e}")  # Changed to logger.exception
-        return None
-    except ValueError as e:
-        logger.exception(f"Invalid JSON response: {e}")
-        return None
-
-
-
-def fetch_species_list(page=0):
-    """
-    Fetch a list of species from the IUCN Red List API.
-
-    The IUCN Red List API returns a list of species in the following format:
-
-    {
-        "result": [
-            {
-                "scientific_name": "<scientific name>",
-                "category": "<conservation status>",
-                "population_trend": "<population trend>",
-                "habitat": "<habitat>",
-                "threats": "<threats>",
-                "conservationmeasures": "<conservation measures>",
-            },
-            ...
-        ]
-    }
-
-    :param page: The page number to fetch (0-indexed)
-    :return: A list of species dictionaries
-    """
-    endpoint = "species/page"
-    params = {"page": page}
-    data = api_call(endpoint, params)
-    return data['result'] if data else []
-
-def fetch_species_data(species_name):
-    """
-    Fetch detailed data for a given species.
-
-    :param species_name: The scientific name of the species to fetch data for
-    :return: A dictionary containing the species data
-    """
-    # Fetch the species data
-    species_endpoint = f"species/{species_name}"
-    species_data = api_call(species_endpoint)
-
-    # If the species data is not found, return None
-    if not species_data or 'result' not in species_data or len(species_data['result']) == 0:
-        return None
-
-    species_info = species_data['result'][0]
-
-    # Fetch additional data
-    threats_endpoint = f"species/narrative/{species_name}/threats"
-    threats_data = api_call(threats_endpoint)
-
-    conservation_endpoint = f"species/narrative/{species_name}/conservationmeasures"
-    conservation_data = api_call(conservation_endpoint)
-
-    # Return the species data in a dictionary
-    return {
-        'scientific_name': species_info['scientific_name'],
-        'common_name': species_info.get('main_common_name', 'Not Available'),
-        'category': species_info.get('category', 'Not Available'),
-        'population_trend': species_info.get('population_trend', 'Not Available'),
-        'habitat': species_info.get('habitat', 'Not Available'),
-        # Fetch the threats data if available
-        'threats': threats_data['result'][0]['threats'] if threats_data and threats_data['result'] else 'Not Available',
-        # Fetch the conservation measures data if available
-        'conservation_measures': conservation_data['result'][0]['conservationmeasures'] if conservation_data and conservation_data['result'] else 'Not Available'
-    }
-
-def filter_species_by_status(conservation_status, page=1, per_page=10):
-    """
-    Filter species by conservation status.
-
-    Args:
-        conservation_status (str): The conservation status to filter by. If None, all species are returned.
-        page (int): The page number to return. Defaults to 1.
-        per_page (int): The number of items to return per page. Defaults to 10.
-
-    Returns:
-        A tuple containing a list of filtered species and the total number of pages.
-    """
-    all_species = fetch_species_list()
-    filtered_species = []
-    start_index = (page - 1) * per_page
-    end_index = start_index + per_page
-    
-    # Iterate over the species in the current page
-    for species in all_species[start_index:end_index]:
-        species_data = fetch_species_data(species['scientific_name'])
-        if species_data:
-            # If the conservation status matches, add it to the filtered list
-            if conservation_status is None or species_data['category'] == conservation_status:
-                filtered_species.append(species_data)
-    
-    # Calculate the total number of pages
-    total_pages = -(-len(all_species) // per_page)
-    return filtered_species, total_pages
-
-
-def create_conservation_status_chart(species_list):
-    """
-    Create a pie chart of conservation statuses from the provided list of species.
-
-    Args:
-        species_list (list): A list of species dictionaries as returned by fetch_species_data() or fetch_species_list().
-
-    Returns:
-        A Plotly figure object representing a pie chart of conservation status distribution.
-    """
-    # Initialize an empty dictionary to store the count of each conservation status
-    status_counts = {}
-    
-    # Iterate over the species in the list and count the conservation status of each
-    for species in species_list:
-        status = species['category']
-        status_counts[status] = status_counts.get(status, 0) + 1
-    
-    # Create the pie chart figure using the counts
-    fig = go.Figure(data=[go.Pie(labels=list(status_counts.keys()), values=list(status_counts.values()))])
-    fig.update_layout(title_text="Conservation Status Distribution")
-    return fig
-
-
-def create_population_trend_chart(species_list):
-    """
-    Create a bar chart of population trends.
-
-    Args:
-        species_list (list): A list of species dictionaries as returned by fetch_species_data() or fetch_species_list().
-
-    Returns:
-        A Plotly figure object representing a bar chart of population trend distribution.
-    """
-    # Initialize an empty dictionary to store the count of each population trend
-    trend_counts = {}
-    
-    # Iterate over the species in the list and count the population trend of each
-    for species in species_list:
-        trend = species['population_trend']
-        trend_counts[trend] = trend_counts.get(trend, 0) + 1
-    
-    # Create the bar chart figure using the counts
-    fig = go.Figure(data=[go.Bar(x=list(trend_counts.keys()), y=list(trend_counts.values()))])
-    fig.update_layout(title_text="Population Trends", xaxis_title="Trend", yaxis_title="Count")
-    return fig
-
-
-def interface(species_name, conservation_status, page):
-    """
-    Interface function for the Gradio app.
-
-    Args:
-        species_name (str): The scientific name of a species to fetch data for.
-        conservation_status (str): The conservation status to filter by.
-        page (int): The page number of species to return.
-
-    Returns:
-        A tuple containing a formatted string of species data (if species_name is not None),
-        a conservation status distribution chart, a population trend distribution chart,
-        and two Gradio update objects to control the visibility of the charts and the page number input.
-    """
-    if species_name:
-        species_data = fetch_species_data(species_name)
-        if species_data:
-            formatted_output = f"""
-            **Scientific Name:** {species_data['scientific_name']}
-            **Common Name:** {species_data['common_name']}
-            **Conservation Status:** {species_data['category']}
-            **Population Trend:** {species_data['population_trend']}
-            **Habitat:** {species_data['habitat']}
-            **Threats:** {species_data['threats']}
-            **Conservation Measures:** {species_data['conservation_measures']}
-            """
-            status_chart = create_conservation_status_chart([species_data])
-            trend_chart = create_population_trend_chart([species_data])
-            return formatted_output, status_chart, trend_chart, gr.update(visible=False), gr.update(visible=False)
-        else:
-            return "Species not found or error fetching data.", None, None, gr.update(visible=False), gr.update(visible=False)
-    else:
-        species_list, total_pages = filter_species_by_status(conservation_status, page)
-        if species_list:
-            formatted_list = "\n\n".join([
-                f"**Scientific Name:** {s['scientific_name']}\n**Common Name:** {s['common_name']}\n**Conservation Status:** {s['category']}\n**Population Trend:** {s['population_trend']}"
-                for s in species_list])
-            status_chart = create_conservation_status_chart(species_list)
-            trend_chart = create_population_trend_chart(species_list)
-            return formatted_list, status_chart, trend_chart, gr.update(visible=True), gr.update(visible=True, maximum=total_pages)
-        else:
-            return "No species found with the selected conservation status.", None, None, gr.update(visible=False), gr.update(visible=False)
-
-def change_page(direction, current_page):
-    """
-    Change the page number by the given direction.
-
-    Args:
-        direction (int): 1 to go to the next page, -1 to go to the previous page.
-        current_page (int): The current page number.
-
-    Returns:
-        int: The new page number.
-    """
-    return max(1, current_page + direction)
-
-with gr.Blocks() as demo:
-    gr.Markdown("# Endangered Species Tracker")
-    gr.Markdown("## Search for Endangered Species and Their Conservation Status")
-
-    with gr.Row():
-        with gr.Column(scale=2):
-            species_input = gr.Textbox(label="Enter Species Name:")
-        with gr.Column(scale=1):
-            conservation_status_filter = gr.Radio(
-                label="Filter by Conservation Status:",
-                choices=["Vulnerable", "Endangered", "Critically Endangered", "Least Concern", "Not Available", None],
-                value=None
-            )
-
-    submit_btn = gr.Button("Submit")
-    output = gr.Markdown()
-    status_chart = gr.Plot()
-    trend_chart = gr.Plot()
-    
-    with gr.Row():
-        prev_btn = gr.Button("Previous Page", visible=False)
-        page_number = gr.Number(value=1, label="Page", visible=False)
-        next_btn = gr.Button("Next Page", visible=False)
-
-    submit_btn.click(
-        interface,
-        inputs=[species_input, conservation_status_filter, page_number],
-        outputs=[output, status_chart, trend_chart, prev_btn, next_btn]
-    )
-
-    prev_btn.click(
-        change_page,
-        inputs=[gr.Number(value=-1, visible=False), page_number],
-        outputs=page_number
-    ).then(
-        interface,
-        inputs=[species_input, conservation_status_filter, page_number],
-        outputs=[output, status_chart, trend_chart, prev_btn, next_btn]
-    )
-
-    next_btn.click(
-        change_page,
-        inputs=[gr.Number(value=1, visible=False), page_number],
-        outputs=page_number
-    ).then(
-        interface,
-        inputs=[species_input, conservation_status_filter, page_number],
-        outputs=[output, status_chart, trend_chart, prev_btn, next_btn]
-    )
-
-    page_number.change(
-        interface,
-        inputs=[species_input, conservation_status_filter, page_number],
-        outputs=[output, status_chart, trend_chart, prev_btn, next_btn]
-    )
-
-demo.launch(share=True)
+import asyncio
+import atexit
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+import threading
+from urllib.parse import quote
+import gradio as gr
+from functools import lru_cache
+import pandas as pd
+import logging
+import time
+
+from client import (API_CACHE_TTL, _FetchFailed, afetch, api_call,
+                    disk_cache, fetch_fresh, get_async_client)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Shared worker pool for the sync fetch paths (cache warming, background
+# prefetch); the rate limiter in client.py keeps concurrency within the
+# IUCN quota.
+EXECUTOR = ThreadPoolExecutor(max_workers=16)
+atexit.register(EXECUTOR.shutdown, wait=False)
+
+# Markdown template for the species detail view, compiled once at import
+SPECIES_DETAIL_TEMPLATE = Template("""
+            **Scientific Name:** $scientific_name
+            **Common Name:** $common_name
+            **Conservation Status:** $category
+            **Population Trend:** $population_trend
+            **Habitat:** $habitat
+            **Threats:** $threats
+            **Conservation Measures:** $conservation_measures
+            """)
+
+
+def fetch_species_list(page=0):
+    """
+    Fetch a list of species from the IUCN Red List API.
+
+    The IUCN Red List API returns a list of species in the following format:
+
+    {
+        "result": [
+            {
+                "scientific_name": "<scientific name>",
+                "category": "<conservation status>",
+                "population_trend": "<population trend>",
+                "habitat": "<habitat>",
+                "threats": "<threats>",
+                "conservationmeasures": "<conservation measures>",
+            },
+            ...
+        ]
+    }
+
+    The list endpoint is hit on every pagination click but the underlying
+    data changes daily at most, so it gets its own cache: the time-bucket
+    key argument auto-expires entries hourly with no eviction bookkeeping.
+
+    :param page: The page number to fetch (0-indexed)
+    :return: A list of species dictionaries
+    """
+    try:
+        return _species_list(page, int(time.time() // LIST_CACHE_TTL))
+    except _FetchFailed:
+        return []
+
+
+LIST_CACHE_TTL = 3600  # seconds
+
+
+@lru_cache(maxsize=64)
+def _species_list(page, bucket):
+    data = fetch_fresh("species/page", (("page", page),))
+    if data is None:
+        # Raise rather than return []: lru_cache skips raising calls, so a
+        # transient failure isn't served as an empty landing page for the
+        # rest of the hour bucket
+        raise _FetchFailed("species/page")
+    return data['result']
+
+def fetch_species_data(species_name):
+    """
+    Fetch detailed data for a given species.
+
+    :param species_name: The scientific name of the species to fetch data for
+    :return: A dictionary containing the species data
+    """
+    # Resolve the species first so a typo'd name doesn't waste the two
+    # narrative round trips (quote the name: scientific names contain
+    # spaces and occasionally Unicode)
+    species_data = api_call(f"species/{quote(species_name)}")
+
+    # If the species data is not found, return None
+    if not species_data or 'result' not in species_data or len(species_data['result']) == 0:
+        return None
+
+    # Only now fetch the narratives, in parallel — they depend solely on
+    # the (now validated) species name
+    f_threats = EXECUTOR.submit(
+        api_call, f"species/narrative/{quote(species_name)}/threats")
+    f_conservation = EXECUTOR.submit(
+        api_call, f"species/narrative/{quote(species_name)}/conservationmeasures")
+    threats_data = f_threats.result()
+    conservation_data = f_conservation.result()
+
+    record = _build_species_record(species_data, threats_data, conservation_data)
+    _index_category(species_name, record)
+    return record
+
+
+def _index_category(species_name, record):
+    """
+    Index a fetched species' category so later status-filter passes can rule
+    the species out without any HTTP call. The raw endpoint responses are
+    cached at the client level, so no record-level copy is kept.
+    """
+    disk_cache.set(('category', species_name), record['category'],
+                   expire=API_CACHE_TTL)
+
+
+def _build_species_record(species_data, threats_data, conservation_data):
+    """
+    Project the three raw API responses into the species dictionary used by
+    the rest of the app.
+
+    :param species_data: JSON response from the species endpoint
+    :param threats_data: JSON response from the threats narrative endpoint
+    :param conservation_data: JSON response from the conservation narrative endpoint
+    :return: A dictionary containing the species data
+    """
+    species_info = species_data['result'][0]
+
+    # Return the species data in a dictionary
+    return {
+        'scientific_name': species_info['scientific_name'],
+        'common_name': species_info.get('main_common_name', 'Not Available'),
+        'category': species_info.get('category', 'Not Available'),
+        'population_trend': species_info.get('population_trend', 'Not Available'),
+        'habitat': species_info.get('habitat', 'Not Available'),
+        # Fetch the threats data if available
+        'threats': threats_data['result'][0]['threats'] if threats_data and threats_data['result'] else 'Not Available',
+        # Fetch the conservation measures data if available
+        'conservation_measures': conservation_data['result'][0]['conservationmeasures'] if conservation_data and conservation_data['result'] else 'Not Available'
+    }
+
+async def _afetch_species_data(client, species_name):
+    """
+    Async counterpart of fetch_species_data: validates the species first,
+    then fetches the two narratives concurrently.
+
+    :param client: The httpx AsyncClient to use
+    :param species_name: The scientific name of the species to fetch data for
+    :return: A dictionary containing the species data, or None if not found
+    """
+    species_data = await afetch(client, f"species/{quote(species_name)}")
+    if not species_data or 'result' not in species_data or len(species_data['result']) == 0:
+        return None
+    threats_data, conservation_data = await asyncio.gather(
+        afetch(client, f"species/narrative/{quote(species_name)}/threats"),
+        afetch(client, f"species/narrative/{quote(species_name)}/conservationmeasures"),
+    )
+    record = _build_species_record(species_data, threats_data, conservation_data)
+    _index_category(species_name, record)
+    return record
+
+
+# UI labels for the IUCN Red List category codes used by the bulk
+# species/category endpoint
+CATEGORY_CODES = {
+    "Least Concern": "LC",
+    "Near Threatened": "NT",
+    "Vulnerable": "VU",
+    "Endangered": "EN",
+    "Critically Endangered": "CR",
+    "Extinct in the Wild": "EW",
+    "Extinct": "EX",
+}
+
+
+async def _filter_species_by_status_async(conservation_status, page=1, per_page=10):
+    """
+    Async implementation of filter_species_by_status: all species on the page
+    are fetched in parallel, so wall-clock time is ~one round trip instead of
+    one per species.
+
+    When a status filter is set, the bulk species/category endpoint answers
+    the membership question in a single call, so full data is only fetched
+    for the species actually rendered instead of for every row on the page.
+    """
+    start_index = (page - 1) * per_page
+    end_index = start_index + per_page
+
+    code = CATEGORY_CODES.get(conservation_status)
+    if code is not None:
+        # afetch, not api_call: a sync fetch here would block the event
+        # loop (and every concurrent user) for the whole round trip
+        client = await get_async_client()
+        matches = await afetch(client, f"species/category/{code}")
+        if matches and matches.get('result'):
+            names = [s.get('scientific_name') or s.get('taxonname')
+                     for s in matches['result']]
+            names = [name for name in names if name]
+            results = await asyncio.gather(
+                *[_afetch_species_data(client, name)
+                  for name in names[start_index:end_index]],
+                return_exceptions=True)
+            filtered_species = [r for r in results if isinstance(r, dict)]
+            total_pages = -(-len(names) // per_page)
+            return filtered_species, total_pages
+
+    # fetch_species_list is sync (hourly lru bucket over fetch_fresh), so
+    # run it in a worker thread: a bucket miss must not stall the loop
+    all_species = await asyncio.to_thread(fetch_species_list)
+    page_species = all_species[start_index:end_index]
+
+    # Skip species whose indexed category already rules them out; species
+    # not seen before default to a fetch so they can be classified.
+    if conservation_status is not None:
+        page_species = [
+            species for species in page_species
+            if disk_cache.get(('category', species['scientific_name']),
+                              default=conservation_status) == conservation_status
+        ]
+
+    # Dispatch every species on the current page in parallel
+    client = await get_async_client()
+    tasks = [_afetch_species_data(client, species['scientific_name'])
+             for species in page_species]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # If the conservation status matches, add it to the filtered list
+    filtered_species = [
+        species_data for species_data in results
+        if isinstance(species_data, dict)
+        and (conservation_status is None or species_data['category'] == conservation_status)
+    ]
+
+    # Calculate the total number of pages
+    total_pages = -(-len(all_species) // per_page)
+    return filtered_species, total_pages
+
+
+# Prefetches in flight, keyed to their task. Dedupes rapid clicks, and the
+# strong reference keeps the loop (which only holds tasks weakly) from
+# garbage-collecting a prefetch mid-flight.
+_prefetch_tasks = {}
+
+
+def _prefetch_page(conservation_status, page):
+    """
+    Fire-and-forget warm-up of a page the user is likely to visit next; the
+    fetches populate the shared cache so the eventual click is served from it.
+    """
+    key = (conservation_status, page)
+    if page < 1 or key in _prefetch_tasks:
+        return
+
+    async def _run():
+        try:
+            await _filter_species_by_status_async(conservation_status, page)
+        except Exception:
+            logger.exception("Prefetch of page %s failed", page)
+
+    task = asyncio.create_task(_run())
+    _prefetch_tasks[key] = task
+    task.add_done_callback(lambda _: _prefetch_tasks.pop(key, None))
+
+
+def filter_species_by_status(conservation_status, page=1, per_page=10):
+    """
+    Filter species by conservation status.
+
+    Args:
+        conservation_status (str): The conservation status to filter by. If None, all species are returned.
+        page (int): The page number to return. Defaults to 1.
+        per_page (int): The number of items to return per page. Defaults to 10.
+
+    Returns:
+        A tuple containing a list of filtered species and the total number of pages.
+    """
+    return asyncio.run(
+        _filter_species_by_status_async(conservation_status, page, per_page))
+
+
+def _value_counts(values):
+    """
+    Count occurrences of each value. Counter is plenty for page-sized lists;
+    pandas' vectorized value_counts takes over for large ones.
+    """
+    if isinstance(values, pd.Series):
+        return values.value_counts().to_dict()
+    values = list(values)
+    if len(values) > 1000:
+        return pd.Series(values).value_counts().to_dict()
+    return Counter(values)
+
+
+@lru_cache(maxsize=128)
+def _build_pie(items):
+    """
+    Build the conservation-status pie figure from a tuple of sorted
+    (status, count) pairs. Memoized so repeat renders of the same counts
+    skip Plotly figure construction and schema validation entirely.
+
+    Plotly is imported here rather than at module top: it loads its JSON
+    schemas eagerly, which non-UI importers shouldn't pay for.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(labels=[status for status, _ in items],
+                                 values=[count for _, count in items])])
+    fig.update_layout(title_text="Conservation Status Distribution")
+    return fig
+
+
+@lru_cache(maxsize=128)
+def _build_bar(items):
+    """
+    Build the population-trend bar figure from a tuple of sorted
+    (trend, count) pairs. Memoized like _build_pie.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Bar(x=[trend for trend, _ in items],
+                                 y=[count for _, count in items])])
+    fig.update_layout(title_text="Population Trends", xaxis_title="Trend", yaxis_title="Count")
+    return fig
+
+
+def create_conservation_status_chart(species_list):
+    """
+    Create a pie chart of conservation statuses from the provided list of species.
+
+    Args:
+        species_list (list): A list of species dictionaries as returned by fetch_species_data() or fetch_species_list().
+
+    Returns:
+        A Plotly figure object representing a pie chart of conservation status distribution.
+    """
+    # Count the conservation status of each species (C-implemented
+    # counting instead of a Python-level dict.get loop)
+    if isinstance(species_list, pd.DataFrame):
+        status_counts = _value_counts(species_list['category'])
+    else:
+        status_counts = _value_counts(s['category'] for s in species_list)
+    return _build_pie(tuple(sorted(status_counts.items())))
+
+
+def create_population_trend_chart(species_list):
+    """
+    Create a bar chart of population trends.
+
+    Args:
+        species_list (list): A list of species dictionaries as returned by fetch_species_data() or fetch_species_list().
+
+    Returns:
+        A Plotly figure object representing a bar chart of population trend distribution.
+    """
+    # Count the population trend of each species
+    if isinstance(species_list, pd.DataFrame):
+        trend_counts = _value_counts(species_list['population_trend'])
+    else:
+        trend_counts = _value_counts(s['population_trend'] for s in species_list)
+    return _build_bar(tuple(sorted(trend_counts.items())))
+
+
+async def interface(species_name, conservation_status, page):
+    """
+    Interface function for the Gradio app. Declared async so Gradio runs it
+    on its event loop instead of a bounded worker-thread pool: slow IUCN
+    calls no longer starve other users' requests.
+
+    Args:
+        species_name (str): The scientific name of a species to fetch data for.
+        conservation_status (str): The conservation status to filter by.
+        page (int): The page number of species to return.
+
+    Returns:
+        A tuple containing a formatted string of species data (if species_name is not None),
+        a conservation status distribution chart, a population trend distribution chart,
+        and two Gradio update objects to control the visibility of the charts and the page number input.
+    """
+    if species_name:
+        client = await get_async_client()
+        species_data = await _afetch_species_data(client, species_name)
+        if species_data:
+            formatted_output = SPECIES_DETAIL_TEMPLATE.substitute(species_data)
+            status_chart = create_conservation_status_chart([species_data])
+            trend_chart = create_population_trend_chart([species_data])
+            return formatted_output, status_chart, trend_chart, gr.update(visible=False), gr.update(visible=False)
+        else:
+            return "Species not found or error fetching data.", None, None, gr.update(visible=False), gr.update(visible=False)
+    else:
+        species_list, total_pages = await _filter_species_by_status_async(
+            conservation_status, page)
+        # Warm the next page in the background: sequential browsing is the
+        # common case, so the coming click lands on a cache hit
+        if page + 1 <= total_pages:
+            _prefetch_page(conservation_status, page + 1)
+        if species_list:
+            # Column-oriented frame: markdown rendering and chart counting
+            # run on vectorized pandas paths instead of per-row f-strings
+            df = pd.DataFrame(species_list)
+            formatted_list = df[['scientific_name', 'common_name', 'category',
+                                 'population_trend']].to_markdown(index=False)
+            status_chart = create_conservation_status_chart(df)
+            trend_chart = create_population_trend_chart(df)
+            return formatted_list, status_chart, trend_chart, gr.update(visible=True), gr.update(visible=True, maximum=total_pages)
+        else:
+            return "No species found with the selected conservation status.", None, None, gr.update(visible=False), gr.update(visible=False)
+
+async def paginate(direction, species_name, conservation_status, current_page):
+    """
+    Move one page in the given direction and re-render in a single round
+    trip, instead of chaining a page-number update with a second interface
+    call.
+
+    Args:
+        direction (int): 1 to go to the next page, -1 to go to the previous page.
+        species_name (str): The scientific name passed through to interface().
+        conservation_status (str): The status filter passed through to interface().
+        current_page (int): The current page number.
+
+    Returns:
+        A tuple of the new page number followed by interface()'s outputs.
+    """
+    new_page = max(1, int(current_page) + direction)
+    return (new_page,
+            *await interface(species_name, conservation_status, new_page))
+
+def _warm_cache(pages=3, per_page=10):
+    """
+    Pre-fetch the first few species/page pages — the landing query for
+    nearly every user — so early renders are served from cache instead of
+    paying one cold HTTP round trip per species.
+    """
+    try:
+        # Own pool for the outer fan-out: fetch_species_data blocks on
+        # narrative futures submitted to EXECUTOR, so running the outer
+        # tasks there too deadlocks once they occupy every worker
+        with ThreadPoolExecutor(max_workers=4) as warm_pool:
+            for page in range(pages):
+                species = fetch_species_list(page)
+                list(warm_pool.map(fetch_species_data,
+                                   [s['scientific_name'] for s in species[:per_page]]))
+    except Exception:
+        logger.exception("Cache warm-up failed")
+
+
+if __name__ == "__main__":
+    # Warm in the background so startup isn't delayed
+    threading.Thread(target=_warm_cache, daemon=True).start()
+
+    with gr.Blocks() as demo:
+        gr.Markdown("# Endangered Species Tracker")
+        gr.Markdown("## Search for Endangered Species and Their Conservation Status")
+
+        with gr.Row():
+            with gr.Column(scale=2):
+                species_input = gr.Textbox(label="Enter Species Name:")
+            with gr.Column(scale=1):
+                conservation_status_filter = gr.Radio(
+                    label="Filter by Conservation Status:",
+                    choices=["Vulnerable", "Endangered", "Critically Endangered", "Least Concern", "Not Available", None],
+                    value=None
+                )
+
+        submit_btn = gr.Button("Submit")
+        output = gr.Markdown()
+        status_chart = gr.Plot()
+        trend_chart = gr.Plot()
+    
+        with gr.Row():
+            prev_btn = gr.Button("Previous Page", visible=False)
+            page_number = gr.Number(value=1, label="Page", visible=False)
+            next_btn = gr.Button("Next Page", visible=False)
+
+        submit_btn.click(
+            interface,
+            inputs=[species_input, conservation_status_filter, page_number],
+            outputs=[output, status_chart, trend_chart, prev_btn, next_btn]
+        )
+
+        # One handler per button: the page delta is computed server-side, so a
+        # pagination click is a single round trip instead of a page-number
+        # update chained with a second interface() call
+        prev_btn.click(
+            paginate,
+            inputs=[gr.State(-1), species_input, conservation_status_filter, page_number],
+            outputs=[page_number, output, status_chart, trend_chart, prev_btn, next_btn]
+        )
+
+        next_btn.click(
+            paginate,
+            inputs=[gr.State(1), species_input, conservation_status_filter, page_number],
+            outputs=[page_number, output, status_chart, trend_chart, prev_btn, next_btn]
+        )
+
+    demo.launch(share=True)